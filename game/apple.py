@@ -5,10 +5,16 @@
 """
 
 import random
+from collections.abc import Iterable, Set
 import pygame
 from .base import BaseSquare
 
 
+# Доля занятых клеток, до которой свободная клетка ищется случайным
+# выбором; при более плотном заполнении перебирается всё поле.
+SAMPLING_FILL_LIMIT = 0.7
+
+
 class Apple(BaseSquare):
     """Яблоко на игровом поле.
 
@@ -16,6 +22,11 @@ class Apple(BaseSquare):
     появления и отрисовку более детализированного спрайта яблока.
     """
 
+    __slots__ = ()
+
+    # Готовые спрайты яблока: размер клетки -> Surface.
+    _SPRITE_CACHE: dict[int, pygame.Surface] = {}
+
     def __init__(self,
                  cell_x: int,
                  cell_y: int,
@@ -35,27 +46,45 @@ class Apple(BaseSquare):
     def spawn_random(cols: int,
                      rows: int,
                      cell_size: int,
-                     forbidden_cells: list[tuple[int, int]]) -> "Apple":
+                     forbidden_cells: Iterable[tuple[int, int]]) -> "Apple":
         """Создаёт яблоко в случайной свободной клетке.
 
-        Перебирает все клетки поля и исключает те, которые уже заняты
-        (обычно телом змейки). Если свободных клеток нет, яблоко
-        создаётся в (0, 0) как формальный объект.
+        Пока поле заполнено не слишком плотно, клетка выбирается
+        случайно и отбрасывается, если она занята (обычно телом змейки) –
+        в среднем это требует лишь нескольких попыток. При почти
+        заполненном поле перебираются все клетки. Если свободных клеток
+        нет, яблоко создаётся в (0, 0) как формальный объект.
 
         Args:
             cols: Количество колонок поля.
             rows: Количество строк поля.
             cell_size: Размер клетки в пикселях.
-            forbidden_cells: Список занятых клеток (x, y).
+            forbidden_cells: Занятые клетки (x, y); множество используется
+                как есть, остальные коллекции преобразуются в множество.
 
         Returns:
             Экземпляр класса ``Apple`` в свободной клетке.
         """
+        if isinstance(forbidden_cells, Set):
+            forbidden = forbidden_cells
+        else:
+            forbidden = set(forbidden_cells)
+        total = cols * rows
+        if len(forbidden) >= total:
+            return Apple(0, 0, cell_size)
+
+        if len(forbidden) < total * SAMPLING_FILL_LIMIT:
+            while True:
+                x = random.randrange(cols)
+                y = random.randrange(rows)
+                if (x, y) not in forbidden:
+                    return Apple(x, y, cell_size)
+
         free_cells = [
             (x, y)
             for x in range(cols)
             for y in range(rows)
-            if (x, y) not in forbidden_cells
+            if (x, y) not in forbidden
         ]
         if not free_cells:
             x, y = 0, 0
@@ -71,41 +100,78 @@ class Apple(BaseSquare):
         """
         return self.cell_x, self.cell_y
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Отрисовывает яблоко на переданной поверхности.
+    @classmethod
+    def clear_sprite_cache(cls) -> None:
+        """Сбрасывает готовые спрайты (например, при изменении размера окна)."""
+        cls._SPRITE_CACHE.clear()
+
+    @staticmethod
+    def _build_sprite(cell_size: int) -> pygame.Surface:
+        """Рисует спрайт яблока для клетки заданного размера.
 
         Рисуется круг с бликом, коричневая ножка и зелёный листик,
         чтобы объект выглядел как стилизованное яблоко.
 
+        Ножка и листик выступают за верхнюю границу клетки, поэтому
+        спрайт имеет прозрачное поле ``cell_size // 2`` с каждой стороны.
+
         Args:
-            surface: Поверхность Pygame для отрисовки.
+            cell_size: Размер клетки в пикселях.
+
+        Returns:
+            Поверхность со спрайтом на прозрачном фоне.
         """
-        center_x = self.cell_x * self.cell_size + self.cell_size // 2
-        center_y = self.cell_y * self.cell_size + self.cell_size // 2
-        radius = self.cell_size // 2 - 3
+        margin = cell_size // 2
+        side = cell_size + 2 * margin
+        sprite = pygame.Surface((side, side), pygame.SRCALPHA).convert_alpha()
+
+        center_x = margin + cell_size // 2
+        center_y = margin + cell_size // 2
+        radius = cell_size // 2 - 3
 
-        pygame.draw.circle(surface, (220, 0, 0), (center_x, center_y), radius)
+        pygame.draw.circle(sprite, (220, 0, 0), (center_x, center_y), radius)
 
         pygame.draw.circle(
-            surface,
+            sprite,
             (255, 150, 150),
             (center_x - radius // 3, center_y - radius // 3),
             max(1, radius // 4),
         )
 
-        stem_width = max(2, self.cell_size // 10)
-        stem_height = max(3, self.cell_size // 4)
+        stem_width = max(2, cell_size // 10)
+        stem_height = max(3, cell_size // 4)
         stem_rect = pygame.Rect(
             center_x - stem_width // 2,
             center_y - radius - stem_height + 2,
             stem_width,
             stem_height,
         )
-        pygame.draw.rect(surface, (120, 70, 15), stem_rect)
+        pygame.draw.rect(sprite, (120, 70, 15), stem_rect)
 
         leaf_points = [
             (stem_rect.right, stem_rect.top),
-            (stem_rect.right + self.cell_size // 4, stem_rect.top + self.cell_size // 6),
-            (stem_rect.right, stem_rect.top + self.cell_size // 5),
+            (stem_rect.right + cell_size // 4, stem_rect.top + cell_size // 6),
+            (stem_rect.right, stem_rect.top + cell_size // 5),
         ]
-        pygame.draw.polygon(surface, (0, 170, 0), leaf_points)
+        pygame.draw.polygon(sprite, (0, 170, 0), leaf_points)
+        return sprite
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Отрисовывает яблоко на переданной поверхности.
+
+        Спрайт строится один раз для каждого размера клетки и затем
+        только копируется в нужную позицию.
+
+        Args:
+            surface: Поверхность Pygame для отрисовки.
+        """
+        sprite = Apple._SPRITE_CACHE.get(self.cell_size)
+        if sprite is None:
+            sprite = Apple._build_sprite(self.cell_size)
+            Apple._SPRITE_CACHE[self.cell_size] = sprite
+        margin = self.cell_size // 2
+        surface.blit(
+            sprite,
+            (self.cell_x * self.cell_size - margin,
+             self.cell_y * self.cell_size - margin),
+        )
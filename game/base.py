@@ -14,6 +14,8 @@ class BaseSquare:
     методы для получения прямоугольника Pygame и отрисовки.
     """
 
+    __slots__ = ("cell_x", "cell_y", "cell_size", "color")
+
     def __init__(self,
                  cell_x: int,
                  cell_y: int,
@@ -49,7 +51,14 @@ class BaseSquare:
     def draw(self, surface: pygame.Surface) -> None:
         """Рисует квадрат на указанной поверхности.
 
+        Прямоугольник передаётся кортежем, без создания ``pygame.Rect``.
+
         Args:
             surface: Поверхность Pygame, на которую выполняется отрисовка.
         """
-        pygame.draw.rect(surface, self.color, self.rect())
+        size = self.cell_size
+        pygame.draw.rect(
+            surface,
+            self.color,
+            (self.cell_x * size, self.cell_y * size, size, size),
+        )
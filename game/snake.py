@@ -4,19 +4,30 @@
 растёт при поедании яблок и умеет себя отрисовывать.
 """
 
-from .base import BaseSquare
+from collections import Counter, deque
+from collections.abc import Iterable, KeysView
+from itertools import islice
+
 import pygame
 
 
 class Snake:
     """Класс змейки на клеточном поле.
 
-    Хранит координаты сегментов тела в виде списка клеток, текущее
-    направление движения и количество ожидаемых сегментов роста.
+    Хранит координаты сегментов тела в виде очереди клеток (и счётчик
+    сегментов в каждой клетке для быстрой проверки столкновений),
+    текущее направление движения и количество ожидаемых сегментов роста.
     Предоставляет методы движения, изменения направления, роста и
     проверки столкновения с собственным телом.
     """
 
+    __slots__ = ("cell_size", "_body", "_cell_counts", "_direction",
+                 "_grow_pending", "color")
+
+    # Готовые спрайты: размер клетки -> Surface сегмента тела / головы.
+    _BODY_CACHE: dict[int, pygame.Surface] = {}
+    _HEAD_CACHE: dict[int, pygame.Surface] = {}
+
     def __init__(self,
                  start_x: int,
                  start_y: int,
@@ -31,11 +42,20 @@ class Snake:
             color: Базовый цвет змейки (для тела).
         """
         self.cell_size: int = cell_size
-        self._body: list[tuple[int, int]] = [(start_x, start_y)]
+        self._body: deque[tuple[int, int]] = deque([(start_x, start_y)])
+        self._cell_counts: Counter[tuple[int, int]] = Counter(self._body)
         self._direction: tuple[int, int] = (1, 0)
         self._grow_pending: int = 0
         self.color: tuple[int, int, int] = color
 
+    def __len__(self) -> int:
+        """Возвращает длину змейки без копирования списка клеток.
+
+        Returns:
+            Количество сегментов тела.
+        """
+        return len(self._body)
+
     def change_direction(self, dx: int, dy: int) -> None:
         """Меняет направление движения змейки.
 
@@ -57,18 +77,22 @@ class Snake:
         """Делает один шаг змейки в текущем направлении.
 
         Голова перемещается на одну клетку вперёд, новое положение
-        добавляется в начало списка тела. Если есть отложенный рост,
+        добавляется в начало очереди тела. Если есть отложенный рост,
         длина не уменьшается, иначе удаляется последний сегмент.
         """
         head_x, head_y = self._body[0]
         dx, dy = self._direction
         new_head = (head_x + dx, head_y + dy)
-        self._body.insert(0, new_head)
+        self._body.appendleft(new_head)
+        self._cell_counts[new_head] += 1
 
         if self._grow_pending > 0:
             self._grow_pending -= 1
         else:
-            self._body.pop()
+            tail = self._body.pop()
+            self._cell_counts[tail] -= 1
+            if not self._cell_counts[tail]:
+                del self._cell_counts[tail]
 
     def grow(self, amount: int = 1) -> None:
         """Запланировать увеличение длины змейки.
@@ -78,6 +102,19 @@ class Snake:
         """
         self._grow_pending += amount
 
+    def set_body(self, cells: Iterable[tuple[int, int]]) -> None:
+        """Заменяет тело змейки заданной последовательностью клеток.
+
+        Внутренние структуры (очередь сегментов и счётчик клеток)
+        строятся заново, поэтому вызывающему коду не нужно знать, как
+        тело хранится внутри.
+
+        Args:
+            cells: Клетки (x, y) от головы к хвосту.
+        """
+        self._body = deque(cells)
+        self._cell_counts = Counter(self._body)
+
     def head_cell(self) -> tuple[int, int]:
         """Возвращает координаты головы змейки в клетках.
 
@@ -86,6 +123,14 @@ class Snake:
         """
         return self._body[0]
 
+    def tail_cell(self) -> tuple[int, int]:
+        """Возвращает координаты последнего сегмента змейки в клетках.
+
+        Returns:
+            Кортеж (x, y) – координаты хвоста.
+        """
+        return self._body[-1]
+
     def body_cells(self) -> list[tuple[int, int]]:
         """Возвращает копию списка всех клеток тела змейки.
 
@@ -94,6 +139,17 @@ class Snake:
         """
         return list(self._body)
 
+    def body_set(self) -> KeysView[tuple[int, int]]:
+        """Возвращает множество клеток, занятых змейкой, без копирования.
+
+        Это представление только для чтения, которое меняется вместе
+        со змейкой; проверка принадлежности клетки выполняется за O(1).
+
+        Returns:
+            Множество кортежей (x, y) занятых клеток.
+        """
+        return self._cell_counts.keys()
+
     def check_self_collision(self) -> bool:
         """Проверяет, столкнулась ли голова с телом змейки.
 
@@ -101,51 +157,64 @@ class Snake:
             True, если голова находится в одной из остальных клеток тела,
             иначе False.
         """
-        head = self._body[0]
-        return head in self._body[1:]
+        return self._cell_counts[self._body[0]] > 1
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Отрисовывает змейку на переданной поверхности.
+    @classmethod
+    def clear_sprite_cache(cls) -> None:
+        """Сбрасывает готовые спрайты (например, при изменении размера окна)."""
+        cls._BODY_CACHE.clear()
+        cls._HEAD_CACHE.clear()
 
-        Тело рисуется прямоугольниками базового цвета, голова –
-        отдельным прямоугольником с глазами и ротиком.
+    @staticmethod
+    def _body_surface(cell_size: int) -> pygame.Surface:
+        """Возвращает спрайт сегмента тела для заданного размера клетки.
 
         Args:
-            surface: Поверхность Pygame, на которую нужно нарисовать змейку.
+            cell_size: Размер клетки в пикселях.
+
+        Returns:
+            Поверхность ``cell_size`` x ``cell_size``, залитая цветом тела.
         """
-        for i, (x, y) in enumerate(self._body):
-            if i == 0:
-                continue
-            square = BaseSquare(x, y, self.cell_size, (0, 70, 200))
-            square.draw(surface)
+        sprite = Snake._BODY_CACHE.get(cell_size)
+        if sprite is None:
+            sprite = pygame.Surface((cell_size, cell_size)).convert()
+            sprite.fill((0, 70, 200))
+            Snake._BODY_CACHE[cell_size] = sprite
+        return sprite
 
-        head_x, head_y = self._body[0]
-        head_rect = pygame.Rect(
-            head_x * self.cell_size,
-            head_y * self.cell_size,
-            self.cell_size,
-            self.cell_size,
-        )
-        pygame.draw.rect(surface, (0, 120, 255), head_rect)
+    @staticmethod
+    def _head_surface(cell_size: int) -> pygame.Surface:
+        """Возвращает спрайт головы для заданного размера клетки.
 
-        eye_size = self.cell_size // 4
-        eye_offset_x = self.cell_size // 6
-        eye_offset_y = self.cell_size // 6
+        Голова – прямоугольник с глазами и ротиком, целиком занимающий
+        клетку, поэтому спрайт не нуждается в прозрачности.
 
-        left_eye = pygame.Rect(
-            head_rect.x + eye_offset_x,
-            head_rect.y + eye_offset_y,
-            eye_size,
-            eye_size,
-        )
+        Args:
+            cell_size: Размер клетки в пикселях.
+
+        Returns:
+            Поверхность ``cell_size`` x ``cell_size`` с головой змейки.
+        """
+        sprite = Snake._HEAD_CACHE.get(cell_size)
+        if sprite is not None:
+            return sprite
+
+        sprite = pygame.Surface((cell_size, cell_size)).convert()
+        sprite.fill((0, 120, 255))
+
+        eye_size = cell_size // 4
+        eye_offset_x = cell_size // 6
+        eye_offset_y = cell_size // 6
+
+        left_eye = pygame.Rect(eye_offset_x, eye_offset_y, eye_size, eye_size)
         right_eye = pygame.Rect(
-            head_rect.x + self.cell_size - eye_offset_x - eye_size,
-            head_rect.y + eye_offset_y,
+            cell_size - eye_offset_x - eye_size,
+            eye_offset_y,
             eye_size,
             eye_size,
         )
-        pygame.draw.rect(surface, (255, 255, 255), left_eye)
-        pygame.draw.rect(surface, (255, 255, 255), right_eye)
+        pygame.draw.rect(sprite, (255, 255, 255), left_eye)
+        pygame.draw.rect(sprite, (255, 255, 255), right_eye)
 
         pupil_size = max(1, eye_size // 3)
         left_pupil = pygame.Rect(
@@ -160,14 +229,37 @@ class Snake:
             pupil_size,
             pupil_size,
         )
-        pygame.draw.rect(surface, (0, 0, 0), left_pupil)
-        pygame.draw.rect(surface, (0, 0, 0), right_pupil)
+        pygame.draw.rect(sprite, (0, 0, 0), left_pupil)
+        pygame.draw.rect(sprite, (0, 0, 0), right_pupil)
 
-        mouth_height = max(1, self.cell_size // 8)
+        mouth_height = max(1, cell_size // 8)
         mouth_rect = pygame.Rect(
-            head_rect.x + self.cell_size // 4,
-            head_rect.y + self.cell_size - mouth_height - 2,
-            self.cell_size // 2,
+            cell_size // 4,
+            cell_size - mouth_height - 2,
+            cell_size // 2,
             mouth_height,
         )
-        pygame.draw.rect(surface, (0, 0, 150), mouth_rect)
+        pygame.draw.rect(sprite, (0, 0, 150), mouth_rect)
+
+        Snake._HEAD_CACHE[cell_size] = sprite
+        return sprite
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Отрисовывает змейку на переданной поверхности.
+
+        Все сегменты тела передаются в одном вызове ``Surface.blits``,
+        голова рисуется отдельным спрайтом с глазами и ротиком. Спрайты
+        строятся один раз для каждого размера клетки.
+
+        Args:
+            surface: Поверхность Pygame, на которую нужно нарисовать змейку.
+        """
+        cs = self.cell_size
+        body = Snake._body_surface(cs)
+        surface.blits(
+            [(body, (x * cs, y * cs)) for x, y in islice(self._body, 1, None)],
+            doreturn=False,
+        )
+
+        head_x, head_y = self._body[0]
+        surface.blit(Snake._head_surface(cs), (head_x * cs, head_y * cs))
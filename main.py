@@ -4,8 +4,10 @@
 и настройку параметров игрока (имя, скорость, сложность).
 """
 
+import atexit
 import sys
 from datetime import datetime
+from typing import Optional, TextIO
 
 import pygame
 
@@ -13,42 +15,92 @@ from game.snake import Snake
 from game.apple import Apple
 
 
-VIRTUAL_WIDTH = 1300
-VIRTUAL_HEIGHT = 1300
-
 GRID_COLS = 15
 GRID_ROWS = 15
-CELL_SIZE = VIRTUAL_WIDTH // GRID_COLS
 
 FPS_BASE = 30
 
 LIGHT_GREEN = (170, 215, 81)
 DARK_GREEN = (162, 209, 73)
 BORDER_COLOR = (0, 0, 0)
+MARGIN_COLOR = (30, 120, 60)
+
+# Размер окна, для которого в пикселях заданы элементы главного меню
+# и надписи/кнопки игрового экрана.
+MENU_REFERENCE_SIZE = 1300
+
+# Клавиши управления: код клавиши -> направление (dx, dy).
+DIR_KEYS: dict[int, tuple[int, int]] = {
+    pygame.K_w: (0, -1),
+    pygame.K_UP: (0, -1),
+    pygame.K_s: (0, 1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_a: (-1, 0),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_d: (1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+
+# Клавиши изменения скорости: код клавиши -> шаг скорости.
+SPEED_KEYS: dict[int, int] = {
+    pygame.K_PLUS: 1,
+    pygame.K_EQUALS: 1,
+    pygame.K_KP_PLUS: 1,
+    pygame.K_MINUS: -1,
+    pygame.K_UNDERSCORE: -1,
+    pygame.K_KP_MINUS: -1,
+}
 
 STATE_MENU = "menu"
 STATE_GAME = "game"
 
+# Заранее отрисованные игровые поля: (cols, rows, cell_size) -> Surface.
+_BG_CACHE: dict[tuple[int, int, int], pygame.Surface] = {}
+
+# Файл статистики, открытый на дозапись при первом сохранении результата.
+_RESULTS_FILE: Optional[TextIO] = None
+
+
+def load_sound(path: str) -> Optional[pygame.mixer.Sound]:
+    """Загружает звуковой эффект из файла.
+
+    Args:
+        path: Путь к WAV-файлу.
+
+    Returns:
+        Объект ``pygame.mixer.Sound`` или None, если звук не удалось
+        загрузить (нет файла или недоступно звуковое устройство).
+    """
+    try:
+        return pygame.mixer.Sound(path)
+    except Exception:
+        return None
+
 
 def save_result(player_name: str, score: int) -> None:
     """Сохраняет результат одной игры в файл статистики.
 
     Строка сохраняется в формате: ``YYYY-MM-DD HH:MM:SS;Имя;Счёт``.
+    Файл открывается один раз за время работы программы и закрывается
+    при выходе; построчная буферизация сразу сбрасывает запись на диск.
 
     Args:
         player_name: Имя игрока.
         score: Набранный счёт.
     """
-    with open("results.txt", "a", encoding="utf-8") as f:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        f.write(f"{now};{player_name};{score}\n")
+    global _RESULTS_FILE
+    if _RESULTS_FILE is None:
+        _RESULTS_FILE = open("results.txt", "a", encoding="utf-8", buffering=1)
+        atexit.register(_RESULTS_FILE.close)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _RESULTS_FILE.write(f"{now};{player_name};{score}\n")
 
 
 def load_best_score() -> int:
     """Считывает лучший результат из файла статистики.
 
     Файл ``results.txt`` просматривается построчно, из каждой строки
-    извлекается значение счёта, после чего выбирается максимум.
+    извлекается последнее поле (счёт), после чего выбирается максимум.
 
     Returns:
         Максимальный счёт среди всех записей или 0, если файла ещё нет
@@ -58,10 +110,10 @@ def load_best_score() -> int:
     try:
         with open("results.txt", "r", encoding="utf-8") as f:
             for line in f:
-                parts = line.strip().split(";")
-                if len(parts) >= 3:
+                head, sep, tail = line.rpartition(";")
+                if sep and ";" in head:
                     try:
-                        s = int(parts[2])
+                        s = int(tail)
                         if s > best:
                             best = s
                     except ValueError:
@@ -71,6 +123,49 @@ def load_best_score() -> int:
     return best
 
 
+def background_surface(cols: int,
+                       rows: int,
+                       cell_size: int) -> pygame.Surface:
+    """Возвращает поверхность с шахматным игровым полем и рамкой.
+
+    Поле не меняется во время игры, поэтому оно рисуется один раз
+    и запоминается для данного размера поля.
+
+    Args:
+        cols: Количество колонок клеток.
+        rows: Количество строк клеток.
+        cell_size: Размер клетки в пикселях.
+
+    Returns:
+        Поверхность размером ``cols * cell_size`` x ``rows * cell_size``.
+    """
+    key = (cols, rows, cell_size)
+    bg = _BG_CACHE.get(key)
+    if bg is None:
+        bg = pygame.Surface((cols * cell_size, rows * cell_size)).convert()
+        for x in range(cols):
+            for y in range(rows):
+                if (x + y) % 2 == 0:
+                    color = LIGHT_GREEN
+                else:
+                    color = DARK_GREEN
+                rect = pygame.Rect(
+                    x * cell_size,
+                    y * cell_size,
+                    cell_size,
+                    cell_size,
+                )
+                pygame.draw.rect(bg, color, rect)
+        pygame.draw.rect(
+            bg,
+            BORDER_COLOR,
+            pygame.Rect(0, 0, cols * cell_size, rows * cell_size),
+            width=2,
+        )
+        _BG_CACHE[key] = bg
+    return bg
+
+
 def draw_background(surface: pygame.Surface,
                     cols: int,
                     rows: int,
@@ -83,25 +178,106 @@ def draw_background(surface: pygame.Surface,
         rows: Количество строк клеток.
         cell_size: Размер клетки в пикселях.
     """
-    for x in range(cols):
-        for y in range(rows):
-            if (x + y) % 2 == 0:
-                color = LIGHT_GREEN
-            else:
-                color = DARK_GREEN
-            rect = pygame.Rect(
-                x * cell_size,
-                y * cell_size,
-                cell_size,
-                cell_size,
-            )
-            pygame.draw.rect(surface, color, rect)
-    pygame.draw.rect(
-        surface,
-        BORDER_COLOR,
-        pygame.Rect(0, 0, cols * cell_size, rows * cell_size),
-        width=2,
-    )
+    surface.blit(background_surface(cols, rows, cell_size), (0, 0))
+
+
+def ui_scale(screen_size: tuple[int, int]) -> float:
+    """Возвращает коэффициент масштабирования интерфейса для окна.
+
+    Размеры элементов заданы для квадратного окна со стороной
+    ``MENU_REFERENCE_SIZE`` и масштабируются по меньшей стороне окна.
+
+    Args:
+        screen_size: Размер окна ``(ширина, высота)`` в пикселях.
+
+    Returns:
+        Коэффициент масштабирования.
+    """
+    return min(screen_size) / MENU_REFERENCE_SIZE
+
+
+def scale_px(value: int, scale: float) -> int:
+    """Масштабирует размер в пикселях, оставляя его не меньше 1.
+
+    Args:
+        value: Размер для окна эталонного размера.
+        scale: Коэффициент масштабирования.
+
+    Returns:
+        Масштабированный размер в пикселях.
+    """
+    return max(1, round(value * scale))
+
+
+def field_layout(screen_size: tuple[int, int],
+                 cols: int,
+                 rows: int) -> tuple[int, pygame.Rect]:
+    """Подбирает размер клетки и положение поля под размер окна.
+
+    Поле получает наибольший целый размер клетки, при котором оно
+    целиком помещается в окно, и располагается по центру.
+
+    Args:
+        screen_size: Размер окна ``(ширина, высота)`` в пикселях.
+        cols: Количество колонок клеток.
+        rows: Количество строк клеток.
+
+    Returns:
+        Кортеж ``(cell_size, rect)`` – размер клетки в пикселях
+        и прямоугольник поля в координатах окна.
+    """
+    screen_w, screen_h = screen_size
+    cell_size = max(1, min(screen_w // cols, screen_h // rows))
+    width = cols * cell_size
+    height = rows * cell_size
+    rect = pygame.Rect((screen_w - width) // 2,
+                       (screen_h - height) // 2,
+                       width,
+                       height)
+    return cell_size, rect
+
+
+def game_over_buttons(screen_size: tuple[int, int]) -> tuple[pygame.Rect, pygame.Rect]:
+    """Возвращает прямоугольники кнопок экрана окончания игры.
+
+    Args:
+        screen_size: Размер окна ``(ширина, высота)`` в пикселях.
+
+    Returns:
+        Кортеж ``(restart_rect, quit_rect)`` для кнопок «Играть снова»
+        и «Выход» в координатах окна.
+    """
+    scale = ui_scale(screen_size)
+    button_width = scale_px(260, scale)
+    button_height = scale_px(60, scale)
+    button_margin = scale_px(20, scale)
+    btn_x = (screen_size[0] - button_width) // 2
+    btn_y_restart = screen_size[1] // 2 + scale_px(40, scale)
+    btn_y_quit = btn_y_restart + button_height + button_margin
+    restart_rect = pygame.Rect(btn_x, btn_y_restart, button_width, button_height)
+    quit_rect = pygame.Rect(btn_x, btn_y_quit, button_width, button_height)
+    return restart_rect, quit_rect
+
+
+def dim_overlay(screen_size: tuple[int, int]) -> pygame.Surface:
+    """Создаёт полупрозрачное затемнение для паузы и конца игры.
+
+    Args:
+        screen_size: Размер окна ``(ширина, высота)`` в пикселях.
+
+    Returns:
+        Поверхность размера окна, залитая полупрозрачным чёрным цветом.
+    """
+    overlay = pygame.Surface(screen_size, pygame.SRCALPHA).convert_alpha()
+    overlay.fill((0, 0, 0, 120))
+    return overlay
+
+
+def clear_sprite_caches() -> None:
+    """Сбрасывает заранее отрисованные поле и спрайты объектов."""
+    _BG_CACHE.clear()
+    Apple.clear_sprite_cache()
+    Snake.clear_sprite_cache()
 
 
 def run_menu(screen: pygame.Surface,
@@ -123,12 +299,6 @@ def run_menu(screen: pygame.Surface,
     """
     running = True
 
-    menu_surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT)).convert()
-
-    font_big = pygame.font.SysFont(None, 96)
-    font = pygame.font.SysFont(None, 48)
-    small_font = pygame.font.SysFont(None, 32)
-
     selected_speed = 10
     min_speed = 3
     max_speed = 25
@@ -138,46 +308,85 @@ def run_menu(screen: pygame.Surface,
     player_name = ""
     active_name = False
 
-    center_x = VIRTUAL_WIDTH // 2
-    row_y1 = VIRTUAL_HEIGHT // 3
-    row_y2 = row_y1 + 130
-    row_y3 = row_y2 + 130
-    row_y4 = row_y3 + 130
-
-    field_width = 400
-    field_height = 60
-    btn_square = 60
-
-    name_rect = pygame.Rect(center_x - field_width // 2,
-                            row_y1,
-                            field_width,
-                            field_height)
-
-    speed_minus_rect = pygame.Rect(center_x - field_width // 2,
-                                   row_y2,
-                                   btn_square,
-                                   btn_square)
-    speed_value_rect = pygame.Rect(
-        center_x - field_width // 2 + btn_square + 10,
-        row_y2,
-        field_width - 2 * (btn_square + 10),
-        btn_square,
-    )
-    speed_plus_rect = pygame.Rect(center_x + field_width // 2 - btn_square,
-                                  row_y2,
-                                  btn_square,
-                                  btn_square)
-
-    difficulty_rect = pygame.Rect(center_x - field_width // 2,
-                                  row_y3,
-                                  field_width,
-                                  field_height)
-
-    start_rect = pygame.Rect(center_x - 150, row_y4, 300, 70)
+    layout_size = None
 
     while running:
         clock.tick(30)
 
+        if screen.get_size() != layout_size:
+            layout_size = screen.get_size()
+            screen_w, screen_h = layout_size
+            scale = ui_scale(layout_size)
+
+            font_big = pygame.font.SysFont(None, scale_px(96, scale))
+            font = pygame.font.SysFont(None, scale_px(48, scale))
+            small_font = pygame.font.SysFont(None, scale_px(32, scale))
+
+            static = {
+                "title": font_big.render("ЗМЕЙКА", True, (255, 255, 255)),
+                "name": font.render("Имя игрока:", True, (0, 0, 0)),
+                "speed": font.render("Начальная скорость:", True, (0, 0, 0)),
+                "minus": font.render("-", True, (255, 255, 255)),
+                "plus": font.render("+", True, (255, 255, 255)),
+                "difficulty": font.render("Сложность:", True, (0, 0, 0)),
+                "start": font.render("Старт", True, (255, 255, 255)),
+                "hint": small_font.render("ESC - выход, клик по полю имени для ввода",
+                                          True, (0, 0, 0)),
+            }
+            diff_texts = {
+                name: font.render(name.capitalize(), True, (0, 0, 0))
+                for name in difficulties
+            }
+            speed_texts: dict[int, pygame.Surface] = {}
+            rendered_name = None
+
+            field_width = scale_px(400, scale)
+            field_height = scale_px(60, scale)
+            btn_square = scale_px(60, scale)
+            row_step = scale_px(130, scale)
+            gap = scale_px(10, scale)
+            radius = scale_px(10, scale)
+            label_offset = scale_px(50, scale)
+            diff_label_offset = scale_px(60, scale)
+            start_width = scale_px(300, scale)
+            start_height = scale_px(70, scale)
+
+            center_x = screen_w // 2
+            row_y1 = screen_h // 3
+            row_y2 = row_y1 + row_step
+            row_y3 = row_y2 + row_step
+            row_y4 = row_y3 + row_step
+
+            name_rect = pygame.Rect(center_x - field_width // 2,
+                                    row_y1,
+                                    field_width,
+                                    field_height)
+
+            speed_minus_rect = pygame.Rect(center_x - field_width // 2,
+                                           row_y2,
+                                           btn_square,
+                                           btn_square)
+            speed_value_rect = pygame.Rect(
+                center_x - field_width // 2 + btn_square + gap,
+                row_y2,
+                field_width - 2 * (btn_square + gap),
+                btn_square,
+            )
+            speed_plus_rect = pygame.Rect(center_x + field_width // 2 - btn_square,
+                                          row_y2,
+                                          btn_square,
+                                          btn_square)
+
+            difficulty_rect = pygame.Rect(center_x - field_width // 2,
+                                          row_y3,
+                                          field_width,
+                                          field_height)
+
+            start_rect = pygame.Rect(center_x - start_width // 2,
+                                     row_y4,
+                                     start_width,
+                                     start_height)
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -199,84 +408,78 @@ def run_menu(screen: pygame.Surface,
 
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = pygame.mouse.get_pos()
-                sw, sh = screen.get_size()
-                scale_x = VIRTUAL_WIDTH / sw
-                scale_y = VIRTUAL_HEIGHT / sh
-                vx = mx * scale_x
-                vy = my * scale_y
 
-                if name_rect.collidepoint(vx, vy):
+                if name_rect.collidepoint(mx, my):
                     active_name = True
                 else:
                     active_name = False
 
-                if speed_minus_rect.collidepoint(vx, vy):
+                if speed_minus_rect.collidepoint(mx, my):
                     selected_speed = max(min_speed, selected_speed - 1)
-                elif speed_plus_rect.collidepoint(vx, vy):
+                elif speed_plus_rect.collidepoint(mx, my):
                     selected_speed = min(max_speed, selected_speed + 1)
-                elif difficulty_rect.collidepoint(vx, vy):
+                elif difficulty_rect.collidepoint(mx, my):
                     diff_index = (diff_index + 1) % len(difficulties)
-                elif start_rect.collidepoint(vx, vy):
+                elif start_rect.collidepoint(mx, my):
                     if not player_name:
                         player_name = "Player"
                     return player_name, selected_speed, difficulties[diff_index]
 
-        menu_surface.fill((30, 120, 60))
+        screen.fill(MARGIN_COLOR)
 
-        title_surf = font_big.render("ЗМЕЙКА", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(center_x, VIRTUAL_HEIGHT // 5))
-        menu_surface.blit(title_surf, title_rect)
+        title_surf = static["title"]
+        title_rect = title_surf.get_rect(center=(center_x, screen_h // 5))
+        screen.blit(title_surf, title_rect)
 
-        name_label = font.render("Имя игрока:", True, (0, 0, 0))
-        menu_surface.blit(name_label, (center_x - field_width // 2, row_y1 - 50))
+        screen.blit(static["name"], (center_x - field_width // 2, row_y1 - label_offset))
 
         pygame.draw.rect(
-            menu_surface,
+            screen,
             (255, 255, 255) if active_name else (230, 230, 230),
             name_rect,
-            border_radius=10,
+            border_radius=radius,
         )
-        name_display = player_name if player_name else "Введите имя..."
-        color = (0, 0, 0) if player_name else (120, 120, 120)
-        name_text = font.render(name_display, True, color)
-        menu_surface.blit(
+        if player_name != rendered_name:
+            name_display = player_name if player_name else "Введите имя..."
+            color = (0, 0, 0) if player_name else (120, 120, 120)
+            name_text = font.render(name_display, True, color)
+            rendered_name = player_name
+        screen.blit(
             name_text,
-            name_text.get_rect(midleft=(name_rect.x + 15, name_rect.centery)),
+            name_text.get_rect(midleft=(name_rect.x + scale_px(15, scale), name_rect.centery)),
         )
 
-        speed_label = font.render("Начальная скорость:", True, (0, 0, 0))
-        menu_surface.blit(speed_label, (center_x - field_width // 2, row_y2 - 50))
+        screen.blit(static["speed"], (center_x - field_width // 2, row_y2 - label_offset))
 
-        pygame.draw.rect(menu_surface, (50, 50, 50), speed_minus_rect, border_radius=10)
-        pygame.draw.rect(menu_surface, (50, 50, 50), speed_plus_rect, border_radius=10)
-        pygame.draw.rect(menu_surface, (230, 230, 230), speed_value_rect, border_radius=10)
+        pygame.draw.rect(screen, (50, 50, 50), speed_minus_rect, border_radius=radius)
+        pygame.draw.rect(screen, (50, 50, 50), speed_plus_rect, border_radius=radius)
+        pygame.draw.rect(screen, (230, 230, 230), speed_value_rect, border_radius=radius)
 
-        minus_text = font.render("-", True, (255, 255, 255))
-        plus_text = font.render("+", True, (255, 255, 255))
-        value_text = font.render(str(selected_speed), True, (0, 0, 0))
+        minus_text = static["minus"]
+        plus_text = static["plus"]
+        value_text = speed_texts.get(selected_speed)
+        if value_text is None:
+            value_text = font.render(str(selected_speed), True, (0, 0, 0))
+            speed_texts[selected_speed] = value_text
 
-        menu_surface.blit(minus_text, minus_text.get_rect(center=speed_minus_rect.center))
-        menu_surface.blit(plus_text, plus_text.get_rect(center=speed_plus_rect.center))
-        menu_surface.blit(value_text, value_text.get_rect(center=speed_value_rect.center))
+        screen.blit(minus_text, minus_text.get_rect(center=speed_minus_rect.center))
+        screen.blit(plus_text, plus_text.get_rect(center=speed_plus_rect.center))
+        screen.blit(value_text, value_text.get_rect(center=speed_value_rect.center))
 
-        diff_label = font.render("Сложность:", True, (0, 0, 0))
-        menu_surface.blit(diff_label, (center_x - field_width // 2, row_y3 - 60))
+        screen.blit(static["difficulty"],
+                    (center_x - field_width // 2, row_y3 - diff_label_offset))
 
-        pygame.draw.rect(menu_surface, (230, 230, 230), difficulty_rect, border_radius=10)
-        diff_name = difficulties[diff_index].capitalize()
-        diff_text = font.render(diff_name, True, (0, 0, 0))
-        menu_surface.blit(diff_text, diff_text.get_rect(center=difficulty_rect.center))
+        pygame.draw.rect(screen, (230, 230, 230), difficulty_rect, border_radius=radius)
+        diff_text = diff_texts[difficulties[diff_index]]
+        screen.blit(diff_text, diff_text.get_rect(center=difficulty_rect.center))
 
-        pygame.draw.rect(menu_surface, (70, 160, 70), start_rect, border_radius=10)
-        start_text = font.render("Старт", True, (255, 255, 255))
-        menu_surface.blit(start_text, start_text.get_rect(center=start_rect.center))
+        pygame.draw.rect(screen, (70, 160, 70), start_rect, border_radius=radius)
+        start_text = static["start"]
+        screen.blit(start_text, start_text.get_rect(center=start_rect.center))
 
-        hint = small_font.render("ESC - выход, клик по полю имени для ввода", True, (0, 0, 0))
-        menu_surface.blit(hint, (10, VIRTUAL_HEIGHT - hint.get_height() - 10))
+        hint = static["hint"]
+        screen.blit(hint, (gap, screen_h - hint.get_height() - gap))
 
-        sw, sh = screen.get_size()
-        scaled = pygame.transform.smoothscale(menu_surface, (sw, sh))
-        screen.blit(scaled, (0, 0))
         pygame.display.flip()
 
 
@@ -284,7 +487,10 @@ def run_game(screen: pygame.Surface,
              clock: pygame.time.Clock,
              player_name: str,
              base_speed: int,
-             difficulty: str) -> bool:
+             difficulty: str,
+             best_score: int,
+             eat_sound: Optional[pygame.mixer.Sound] = None,
+             gameover_sound: Optional[pygame.mixer.Sound] = None) -> tuple[bool, int]:
     """Запускает один игровой сеанс змейки.
 
     Обрабатывает управление, обновляет позицию змейки и яблока, считает
@@ -296,9 +502,14 @@ def run_game(screen: pygame.Surface,
         player_name: Имя текущего игрока.
         base_speed: Начальная скорость, выбранная в меню.
         difficulty: Строка сложности: 'easy', 'normal' или 'hard'.
+        best_score: Лучший результат на момент начала игры.
+        eat_sound: Звук поедания яблока или None.
+        gameover_sound: Звук окончания игры или None.
 
     Returns:
-        True, если игрок выбрал «Играть снова», иначе False.
+        Кортеж ``(restart, best_score)``, где ``restart`` – True, если
+        игрок выбрал «Играть снова», а ``best_score`` – лучший результат
+        с учётом этой игры.
     """
     if difficulty == "easy":
         speed = max(5, base_speed)
@@ -313,39 +524,24 @@ def run_game(screen: pygame.Surface,
     min_speed = 3
     max_speed = 30
 
-    pygame.mixer.init()
-    try:
-        eat_sound = pygame.mixer.Sound("sounds/eat.wav")
-    except Exception:
-        eat_sound = None
-    try:
-        gameover_sound = pygame.mixer.Sound("sounds/gameover.wav")
-    except Exception:
-        gameover_sound = None
-
-    game_surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT)).convert()
-
     cols = GRID_COLS
     rows = GRID_ROWS
 
-    snake = Snake(cols // 2, rows // 2, CELL_SIZE)
-    apple = Apple.spawn_random(cols, rows, CELL_SIZE, snake.body_cells())
+    cell_size, field_rect = field_layout(screen.get_size(), cols, rows)
+    # Шрифты, надписи и кнопки строятся в начале первого кадра и заново
+    # при каждом изменении размера окна; до этого кнопки пусты, но и
+    # нажать их нельзя – игра ещё не окончена.
+    layout_size = None
+    restart_rect = quit_rect = pygame.Rect(0, 0, 0, 0)
+
+    snake = Snake(cols // 2, rows // 2, cell_size)
+    apple = Apple.spawn_random(cols, rows, cell_size, snake.body_set())
 
     running = True
     game_over = False
     paused = False
+    redraw_all = True
     score = 0
-    best_score = load_best_score()
-
-    font = pygame.font.SysFont(None, 48)
-    small_font = pygame.font.SysFont(None, 28)
-
-    button_width = 260
-    button_height = 60
-    button_margin = 20
-    btn_x = (VIRTUAL_WIDTH - button_width) // 2
-    btn_y_restart = VIRTUAL_HEIGHT // 2 + 40
-    btn_y_quit = btn_y_restart + button_height + button_margin
 
     while running:
         clock.tick(speed)
@@ -355,45 +551,69 @@ def run_game(screen: pygame.Surface,
                 pygame.quit()
                 sys.exit()
 
+            if event.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+                redraw_all = True
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
 
-                if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
-                    speed = min(max_speed, speed + 1)
-                if event.key in (pygame.K_MINUS, pygame.K_UNDERSCORE, pygame.K_KP_MINUS):
-                    speed = max(min_speed, speed - 1)
+                step = SPEED_KEYS.get(event.key)
+                if step:
+                    speed = max(min_speed, min(max_speed, speed + step))
 
                 if event.key == pygame.K_p and not game_over:
                     paused = not paused
+                    redraw_all = True
 
                 if not game_over and not paused:
-                    if event.key in (pygame.K_w, pygame.K_UP):
-                        snake.change_direction(0, -1)
-                    elif event.key in (pygame.K_s, pygame.K_DOWN):
-                        snake.change_direction(0, 1)
-                    elif event.key in (pygame.K_a, pygame.K_LEFT):
-                        snake.change_direction(-1, 0)
-                    elif event.key in (pygame.K_d, pygame.K_RIGHT):
-                        snake.change_direction(1, 0)
+                    direction = DIR_KEYS.get(event.key)
+                    if direction:
+                        snake.change_direction(*direction)
 
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and game_over:
                 mx, my = pygame.mouse.get_pos()
-                screen_w, screen_h = screen.get_size()
-                scale_x = VIRTUAL_WIDTH / screen_w
-                scale_y = VIRTUAL_HEIGHT / screen_h
-                vx = mx * scale_x
-                vy = my * scale_y
-
-                restart_rect = pygame.Rect(btn_x, btn_y_restart, button_width, button_height)
-                quit_rect = pygame.Rect(btn_x, btn_y_quit, button_width, button_height)
-
-                if restart_rect.collidepoint(vx, vy):
-                    return True
-                elif quit_rect.collidepoint(vx, vy):
+
+                if restart_rect.collidepoint(mx, my):
+                    return True, best_score
+                elif quit_rect.collidepoint(mx, my):
                     running = False
 
+        # Pygame заменяет поверхность окна при обработке событий, поэтому
+        # размер проверяется после цикла событий, а подповерхность поля
+        # создаётся заново в каждом кадре и не переживает следующий опрос.
+        if screen.get_size() != layout_size:
+            layout_size = screen.get_size()
+            cell_size, field_rect = field_layout(layout_size, cols, rows)
+            clear_sprite_caches()
+            snake.cell_size = cell_size
+            apple.cell_size = cell_size
+            restart_rect, quit_rect = game_over_buttons(layout_size)
+            overlay = dim_overlay(layout_size)
+
+            scale = ui_scale(layout_size)
+            gap = scale_px(10, scale)
+            radius = scale_px(10, scale)
+            title_offset = scale_px(40, scale)
+            font = pygame.font.SysFont(None, scale_px(48, scale))
+            small_font = pygame.font.SysFont(None, scale_px(28, scale))
+            static = {
+                "hint": small_font.render("P - пауза   +/- - скорость", True, (0, 0, 0)),
+                "pause": font.render("Пауза (P - продолжить)", True, (255, 255, 255)),
+                "game_over": font.render("Игра окончена", True, (255, 255, 255)),
+                "restart": font.render("Играть снова", True, (255, 255, 255)),
+                "quit": font.render("Выход", True, (255, 255, 255)),
+            }
+            score_surf = font.render(f"Счёт: {score}", True, (0, 0, 0))
+            best_surf = font.render(f"Рекорд: {best_score}", True, (0, 0, 0))
+            shown_score = score
+            shown_best = best_score
+            redraw_all = True
+
+        dirty = []
         if not game_over and not paused:
+            prev_head = snake.head_cell()
+            prev_tail = snake.tail_cell()
             snake.move()
             head_x, head_y = snake.head_cell()
 
@@ -409,8 +629,9 @@ def run_game(screen: pygame.Surface,
 
             if not game_over and snake.head_cell() == apple.cell():
                 score += 1
+                redraw_all = True
                 snake.grow()
-                apple = Apple.spawn_random(cols, rows, CELL_SIZE, snake.body_cells())
+                apple = Apple.spawn_random(cols, rows, cell_size, snake.body_set())
                 if eat_sound:
                     eat_sound.play()
 
@@ -422,57 +643,76 @@ def run_game(screen: pygame.Surface,
                 if score > best_score:
                     best_score = score
 
-        draw_background(game_surface, cols, rows, CELL_SIZE)
-        apple.draw(game_surface)
-        snake.draw(game_surface)
-
-        score_surf = font.render(f"Счёт: {score}", True, (0, 0, 0))
-        best_surf = font.render(f"Рекорд: {best_score}", True, (0, 0, 0))
-        game_surface.blit(score_surf, (10, 10))
-        game_surface.blit(best_surf, (10, 20 + score_surf.get_height()))
-
-        hint_text = "P - пауза   +/- - скорость"
-        hint_surf = small_font.render(hint_text, True, (0, 0, 0))
-        game_surface.blit(
+            for x, y in (prev_head, prev_tail, snake.head_cell()):
+                dirty.append(pygame.Rect(x * cell_size, y * cell_size,
+                                         cell_size, cell_size))
+
+        # В слишком маленьком окне поле не помещается даже с клеткой
+        # в 1 пиксель – такие кадры не рисуются до увеличения окна.
+        if not screen.get_rect().contains(field_rect):
+            continue
+        field = screen.subsurface(field_rect)
+
+        # Полная перерисовка нужна при смене счёта, паузе, окончании игры
+        # и изменении окна; в остальных кадрах меняются лишь клетки
+        # головы и хвоста.
+        full_frame = redraw_all or paused or game_over
+        if full_frame:
+            screen.fill(MARGIN_COLOR)
+            draw_background(field, cols, rows, cell_size)
+            redraw_all = False
+        else:
+            bg = background_surface(cols, rows, cell_size)
+            for rect in dirty:
+                field.blit(bg, rect, area=rect)
+        apple.draw(field)
+        snake.draw(field)
+
+        if score != shown_score:
+            score_surf = font.render(f"Счёт: {score}", True, (0, 0, 0))
+            shown_score = score
+        if best_score != shown_best:
+            best_surf = font.render(f"Рекорд: {best_score}", True, (0, 0, 0))
+            shown_best = best_score
+        field.blit(score_surf, (gap, gap))
+        field.blit(best_surf, (gap, 2 * gap + score_surf.get_height()))
+
+        hint_surf = static["hint"]
+        field.blit(
             hint_surf,
-            (10, VIRTUAL_HEIGHT - hint_surf.get_height() - 10),
+            (gap, field_rect.height - hint_surf.get_height() - gap),
         )
 
+        screen_w, screen_h = layout_size
+
         if paused and not game_over:
-            overlay = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            game_surface.blit(overlay, (0, 0))
-            pause_surf = font.render("Пауза (P - продолжить)", True, (255, 255, 255))
-            pause_rect = pause_surf.get_rect(center=(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2))
-            game_surface.blit(pause_surf, pause_rect)
+            screen.blit(overlay, (0, 0))
+            pause_surf = static["pause"]
+            pause_rect = pause_surf.get_rect(center=(screen_w // 2, screen_h // 2))
+            screen.blit(pause_surf, pause_rect)
 
         if game_over:
-            overlay = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            game_surface.blit(overlay, (0, 0))
-
-            title_surf = font.render("Игра окончена", True, (255, 255, 255))
-            title_rect = title_surf.get_rect(center=(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2 - 40))
-            game_surface.blit(title_surf, title_rect)
+            screen.blit(overlay, (0, 0))
 
-            restart_rect = pygame.Rect(btn_x, btn_y_restart, button_width, button_height)
-            quit_rect = pygame.Rect(btn_x, btn_y_quit, button_width, button_height)
+            title_surf = static["game_over"]
+            title_rect = title_surf.get_rect(center=(screen_w // 2, screen_h // 2 - title_offset))
+            screen.blit(title_surf, title_rect)
 
-            pygame.draw.rect(game_surface, (50, 150, 50), restart_rect, border_radius=10)
-            pygame.draw.rect(game_surface, (150, 50, 50), quit_rect, border_radius=10)
+            pygame.draw.rect(screen, (50, 150, 50), restart_rect, border_radius=radius)
+            pygame.draw.rect(screen, (150, 50, 50), quit_rect, border_radius=radius)
 
-            restart_text = font.render("Играть снова", True, (255, 255, 255))
-            quit_text = font.render("Выход", True, (255, 255, 255))
+            restart_text = static["restart"]
+            quit_text = static["quit"]
 
-            game_surface.blit(restart_text, restart_text.get_rect(center=restart_rect.center))
-            game_surface.blit(quit_text, quit_text.get_rect(center=quit_rect.center))
+            screen.blit(restart_text, restart_text.get_rect(center=restart_rect.center))
+            screen.blit(quit_text, quit_text.get_rect(center=quit_rect.center))
 
-        screen_w, screen_h = screen.get_size()
-        scaled = pygame.transform.smoothscale(game_surface, (screen_w, screen_h))
-        screen.blit(scaled, (0, 0))
-        pygame.display.flip()
+        if full_frame:
+            pygame.display.flip()
+        else:
+            pygame.display.update([rect.move(field_rect.topleft) for rect in dirty])
 
-    return False
+    return False, best_score
 
 
 def main() -> None:
@@ -493,13 +733,36 @@ def main() -> None:
     )
     pygame.display.set_caption("Змейка")
 
+    # В очередь попадают только события, которые обрабатывают меню и игра.
+    # TEXTINPUT нужен Pygame, чтобы заполнять KEYDOWN.unicode (в том числе
+    # кириллицей) при вводе имени игрока.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.TEXTINPUT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.VIDEORESIZE,
+        pygame.WINDOWEXPOSED,
+    ])
+
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    eat_sound = load_sound("sounds/eat.wav")
+    gameover_sound = load_sound("sounds/gameover.wav")
+
     clock = pygame.time.Clock()
+    best_score = load_best_score()
 
     while True:
         player_name, base_speed, difficulty = run_menu(screen, clock)
         restart = True
         while restart:
-            restart = run_game(screen, clock, player_name, base_speed, difficulty)
+            restart, best_score = run_game(screen, clock, player_name, base_speed,
+                                           difficulty, best_score,
+                                           eat_sound, gameover_sound)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""Общие фикстуры pytest для тестов игры."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm() -> None:
+    """Один раз прогревает логику змейки перед запуском тестов.
+
+    Первые вызовы методов выполняются вне тела тестов, чтобы разовые
+    затраты на подготовку не попадали во время отдельных тестов.
+    """
+    from game.snake import Snake
+
+    s = Snake(0, 0, 1)
+    s.move()
+    s.grow()
+    s.move()
+    s.check_self_collision()
@@ -24,6 +24,51 @@ class TestApple(unittest.TestCase):
 
         self.assertNotIn(apple.cell(), snake.body_cells())
 
+    def test_spawn_on_crowded_board_uses_last_free_cell(self) -> None:
+        """Проверяет выбор единственной свободной клетки на заполненном поле."""
+        cols = 5
+        rows = 5
+        free = (3, 2)
+        forbidden = [
+            (x, y)
+            for x in range(cols)
+            for y in range(rows)
+            if (x, y) != free
+        ]
+
+        apple = Apple.spawn_random(cols, rows, 20, forbidden)
+
+        self.assertEqual(apple.cell(), free)
+
+    def test_spawn_on_full_board_returns_origin(self) -> None:
+        """Проверяет, что на полностью занятом поле яблоко создаётся в (0, 0)."""
+        cols = 4
+        rows = 3
+        forbidden = [(x, y) for x in range(cols) for y in range(rows)]
+
+        apple = Apple.spawn_random(cols, rows, 20, forbidden)
+
+        self.assertEqual(apple.cell(), (0, 0))
+
+    def test_spawn_accepts_body_set(self) -> None:
+        """Проверяет появление яблока при передаче множества клеток змейки."""
+        cols = 4
+        rows = 4
+        cell_size = 20
+        free = (1, 2)
+
+        snake = Snake(0, 0, cell_size)
+        snake.set_body(
+            (x, y)
+            for x in range(cols)
+            for y in range(rows)
+            if (x, y) != free
+        )
+
+        apple = Apple.spawn_random(cols, rows, cell_size, snake.body_set())
+
+        self.assertEqual(apple.cell(), free)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,59 +1,77 @@
 """Модуль с модульными тестами для класса Snake."""
 
-import unittest
+import copy
+from collections.abc import Callable
+
+import pytest
 
 from game.snake import Snake
 
 
-class TestSnake(unittest.TestCase):
-    """Набор тестов, проверяющих поведение змейки."""
-
-    def setUp(self) -> None:
-        """Создаёт базовый экземпляр змейки перед каждым тестом."""
-        self.cell_size = 20
-        self.snake = Snake(5, 5, self.cell_size)
-
-    def test_initial_length_is_one(self) -> None:
-        """Проверяет, что начальная длина змейки равна одной клетке."""
-        self.assertEqual(len(self.snake.body_cells()), 1)
-
-    def test_move_changes_head_position(self) -> None:
-        """Проверяет, что при движении координаты головы изменяются."""
-        head_before = self.snake.head_cell()
-        self.snake.move()
-        head_after = self.snake.head_cell()
-        self.assertNotEqual(head_before, head_after)
-
-    def test_change_direction_blocks_reverse(self) -> None:
-        """Убеждается, что разворот на 180 градусов запрещён.
-
-        После попытки сменить направление на противоположное змейка
-        продолжает двигаться вперёд, а не назад.
-        """
-        head_before = self.snake.head_cell()
-        self.snake.change_direction(-1, 0)
-        self.snake.move()
-        head_after = self.snake.head_cell()
-        self.assertGreater(head_after[0], head_before[0])
-
-    def test_grow_increases_length(self) -> None:
-        """Проверяет, что метод grow() увеличивает длину змейки."""
-        self.snake.grow()
-        self.snake.move()
-        self.assertEqual(len(self.snake.body_cells()), 2)
-
-    def test_self_collision_detection(self) -> None:
-        """Тестирует корректность обнаружения самоукуса змейки."""
-        s = Snake(5, 5, self.cell_size)
-        s.grow(3)
-        s.move()
-        s.move()
-        s.move()
-        s._body = [(5, 5), (5, 6), (6, 6), (6, 5)]
-        s.change_direction(0, 1)
-        s.move()
-        self.assertTrue(s.check_self_collision())
-
-
-if __name__ == "__main__":
-    unittest.main()
+CELL_SIZE = 20
+
+_PROTOTYPE = Snake(5, 5, CELL_SIZE)
+
+
+@pytest.fixture
+def snake() -> Snake:
+    """Возвращает копию базовой змейки для каждого теста."""
+    return copy.deepcopy(_PROTOTYPE)
+
+
+# Сценарии поведения: (название, действия, проверка итогового состояния).
+# Каждое действие – кортеж из имени метода змейки и его аргументов.
+ACTION_TABLE = [
+    ("initial_len", [],
+     lambda s: len(s) == 1),
+    ("move_changes_head", [("move",)],
+     lambda s: s.head_cell() == (6, 5)),
+    ("move_down", [("change_direction", 0, 1), ("move",)],
+     lambda s: s.head_cell() == (5, 6)),
+    ("move_up", [("change_direction", 0, -1), ("move",)],
+     lambda s: s.head_cell() == (5, 4)),
+    ("blocks_reverse", [("change_direction", -1, 0), ("move",)],
+     lambda s: s.head_cell()[0] > 5),
+    ("grow", [("grow",), ("move",)],
+     lambda s: len(s) == 2),
+]
+
+
+@pytest.mark.parametrize(
+    "actions, pred",
+    [(actions, pred) for _, actions, pred in ACTION_TABLE],
+    ids=[name for name, _, _ in ACTION_TABLE],
+)
+def test_snake(snake: Snake,
+               actions: list[tuple],
+               pred: Callable[[Snake], bool]) -> None:
+    """Выполняет сценарий действий над змейкой и проверяет результат.
+
+    Покрывает начальную длину, движение в разных направлениях, запрет
+    разворота на 180 градусов и рост после вызова grow().
+
+    Args:
+        actions: Последовательность вызовов методов змейки.
+        pred: Условие, которому должно удовлетворять итоговое состояние.
+    """
+    for name, *args in actions:
+        getattr(snake, name)(*args)
+    assert pred(snake)
+
+
+def test_self_collision_detection(snake: Snake) -> None:
+    """Тестирует корректность обнаружения самоукуса змейки."""
+    snake.set_body([(5, 5), (5, 6), (6, 6), (6, 5)])
+    snake.change_direction(0, 1)
+    snake.move()
+    assert snake.check_self_collision()
+
+
+def test_self_collision_after_growing(snake: Snake) -> None:
+    """Проверяет самоукус змейки, выросшей обычными ходами по кругу."""
+    snake.grow(4)
+    snake.move()
+    for dx, dy in ((0, 1), (-1, 0), (0, -1)):
+        snake.change_direction(dx, dy)
+        snake.move()
+    assert snake.check_self_collision()